@@ -0,0 +1,131 @@
+class AlienPool:
+    """
+    Class representing the aliens that are currently in the game.
+
+    The pool moves and draws all aliens in a single pass per frame, the
+        same way BulletPool does for the bullets. The bullets of the aliens
+        are kept in a bullet pool, which moves them and checks them for hits.
+
+    Attributes:
+        aliens (list): The aliens (Spaceship) of the pool.
+        rects (list): The rectangles (pygame.Rect) of the aliens, in the
+            same order as `aliens`. The list is kept up to date when aliens
+            are added or removed, so the hit test can use it as it is.
+        bullet_pool (BulletPool): The pool holding the bullets of the aliens.
+        spare_bullets (list): The bullets (Bullet) of killed aliens, which
+            are given to new aliens instead of creating new bullets.
+    """
+    def __init__(self, bullet_pool):
+        """
+        Initializes an empty AlienPool instance.
+
+        Args:
+            bullet_pool (BulletPool): The pool the bullets of the aliens are
+                added to.
+        """
+        self.aliens = []
+        self.rects = []
+        self.bullet_pool = bullet_pool
+        self.spare_bullets = []
+
+    def add(self, alien):
+        """
+        Adds an alien to the pool, and its bullet to the bullet pool.
+
+        Args:
+            alien (Spaceship): The alien to be moved and drawn by the pool.
+        """
+        self.aliens.append(alien)
+        self.rects.append(alien.placeholder)
+        self.bullet_pool.add(alien.bullet)
+
+    def reuse_bullet(self, damage):
+        """
+        Takes a bullet of a killed alien for a new alien.
+
+        Args:
+            damage (int): The damage the bullet of the new alien deals.
+
+        Returns:
+            Bullet or None: A bullet that is not fired, or None if there is
+                no spare bullet.
+        """
+        if not self.spare_bullets:
+            return None
+
+        bullet = self.spare_bullets.pop()
+        bullet.damage = damage
+        return bullet
+
+    def remove_killed(self):
+        """
+        Removes all killed aliens from the pool, and their bullets from the
+            bullet pool.
+
+        Behavior:
+            - The list of aliens is rebuilt once, instead of searching it
+                for every killed alien.
+            - The bullets of the killed aliens stop flying and are kept as
+                spare bullets for `reuse_bullet`.
+        """
+        killed = [alien for alien in self.aliens if alien.is_killed]
+        if not killed:
+            return
+
+        self.aliens = [alien for alien in self.aliens if not alien.is_killed]
+        self.rects = [alien.placeholder for alien in self.aliens]
+        self.bullet_pool.remove_all(alien.bullet for alien in killed)
+
+        for alien in killed:
+            alien.bullet.is_fired = False
+            self.spare_bullets.append(alien.bullet)
+
+    def step(self, screen_w, screen_h, sound, draw_batch, dirty):
+        """
+        Moves all aliens of the pool, lets them shoot and adds them to the
+            frame's batch of blits.
+
+        Moving, shooting and drawing are done in the same pass, so every
+            alien is visited only once per frame.
+
+        Args:
+            screen_w (int): The width of the screen.
+            screen_h (int): The height of the screen.
+            sound (pygame.mixer.Sound): The sound played when an alien shoots.
+            draw_batch (list): The (surface, position) tuples drawn onto the
+                screen with a single call at the end of the frame.
+            dirty (list): The rectangles (pygame.Rect) of the changed parts
+                of the screen, to which copies of the aliens' rectangles are
+                added.
+
+        Behavior:
+            - Aliens that are already killed are skipped.
+            - An alien that reaches the player is still drawn, but doesn't
+                shoot anymore.
+            - Every alien whose bullet is not in flight may shoot, and the
+                fired bullet is handed to the bullet pool.
+
+        Returns:
+            bool: True if an alien has reached the player, False otherwise.
+        """
+        fire = self.bullet_pool.fire
+        has_reached = False
+
+        for alien in self.aliens:
+            if alien.is_killed:
+                continue
+
+            alien.move(1, screen_w, screen_h)
+            dirty.append(alien.draw(draw_batch))
+
+            # An alien moving to the bottom of the screen is marked as
+            # killed, which means that it reached the player.
+            if alien.is_killed:
+                has_reached = True
+                continue
+
+            bullet = alien.bullet
+            if not bullet.is_fired and alien.alien_shoot(sound):
+                fire(bullet)
+
+        return has_reached
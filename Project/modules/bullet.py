@@ -1,4 +1,5 @@
-from .entity import Entity
+from .colors import WHITE
+from .entity import Entity, load_filled_image
 
 
 class Bullet(Entity):
@@ -12,6 +13,8 @@ class Bullet(Entity):
         damage (int): The amount of damage the bullet deals.
         is_fired (bool): Indicates whether the bullet has been fired.
     """
+    __slots__ = ('damage', 'is_fired')
+
     def __init__(self, width, height, x_pos, y_pos, speed, image_path, damage):
         """
         Initializes a Bullet instance.
@@ -29,11 +32,17 @@ class Bullet(Entity):
         Attributes Initialized:
             is_fired (bool): Initially set to False, indicating the bullet
                 hasn't been fired.
+            image (pygame.Surface): A white surface of the bullet's size if
+                no image is given, so bullets can be blitted in batches.
         """
         super().__init__(width, height, x_pos, y_pos, speed, image_path)
         self.damage = damage
         self.is_fired = False
 
+        if not self.has_image:
+            self.image = load_filled_image(width, height, WHITE)
+            self.has_image = True
+
     def set_coordinates(self, x, y):
         """
         Sets the bullet's coordinates and marks it as fired.
@@ -43,11 +52,13 @@ class Bullet(Entity):
             y (int): The y-coordinate where the bullet is spawned.
 
         Behavior:
-            - Sets the bullet's position to the given (x, y) coordinates.
+            - Sets the bullet's position and placeholder rectangle to the
+                given (x, y) coordinates.
             - Marks the bullet as fired by setting `is_fired` to True.
         """
         self.x_pos = x
         self.y_pos = y
+        self.placeholder.topleft = (x, y)
         self.is_fired = True
 
     def move(self, direction, screen_w, screen_h):
@@ -61,13 +72,15 @@ class Bullet(Entity):
             screen_h (int): The height of the screen.
 
         Behavior:
-            - Updates the bullet's y-coordinate based on its speed and the
-                direction of movement.
+            - Updates the bullet's y-coordinate and placeholder rectangle
+                based on its speed and the direction of movement.
             - If the bullet goes outside the vertical bounds of the screen,
                 it is marked as not fired (`is_fired = False`),
               allowing it to be re-fired.
         """
-        self.y_pos += self.speed * direction
+        y_pos = self.y_pos + self.speed * direction
+        self.y_pos = y_pos
+        self.placeholder.y = y_pos
 
-        if self.y_pos <= 0 or self.y_pos >= screen_h:
+        if y_pos <= 0 or y_pos >= screen_h:
             self.is_fired = False
@@ -1,11 +1,8 @@
 import pygame
 
+from .colors import WHITE
 from .entity import Entity
 
-pygame.init()
-
-WHITE = (255, 255, 255)
-
 
 class Button(Entity):
     """
@@ -22,7 +19,19 @@ class Button(Entity):
             over by the mouse.
         action (callable, optional): A function to be called when the
             button is clicked.
+        _text_surf (pygame.Surface): The pre-rendered text of the button.
+        _text_offset (tuple): The position where the text is blitted so it
+            is centered within the button.
+        _rect (pygame.Rect): The area of the button, used for the hover
+            test and for drawing its background.
+        _colors (tuple): The normal and hover colors, indexed by whether
+            the mouse is over the button.
+        _was_pressed (bool): The state of the left mouse button on the
+            previous draw, used to detect the moment of a click.
     """
+    __slots__ = ('text', 'font', 'color', 'hover_color', 'action', '_rect',
+                 '_colors', '_was_pressed', '_text_surf', '_text_offset')
+
     def __init__(self, width, height, x_pos, y_pos, speed, image_path, text,
                  font, color, hover_color, action=None):
         """
@@ -44,11 +53,35 @@ class Button(Entity):
                 button is clicked.
         """
         super().__init__(width, height, x_pos, y_pos, speed, image_path)
-        self.text = text
         self.font = font
         self.color = color
         self.hover_color = hover_color
         self.action = action
+        self._rect = pygame.Rect(self.x_pos, self.y_pos, self.width,
+                                 self.height)
+        self._colors = (color, hover_color)
+        # Starts as pressed so a click that opened this button's menu
+        # does not also trigger it.
+        self._was_pressed = True
+        self.set_text(text)
+
+    def set_text(self, text):
+        """
+        Sets the button's text and renders it once for all following draws.
+
+        Args:
+            text (str): The new text displayed on the button.
+
+        Behavior:
+            - Renders the text and computes the offset that centers it
+                within the button, so `draw` only has to blit it.
+        """
+        self.text = text
+        self._text_surf = self.font.render(self.text, True,
+                                           WHITE).convert_alpha()
+        text_w, text_h = self._text_surf.get_size()
+        self._text_offset = (self.x_pos + self.width // 2 - text_w // 2,
+                             self.y_pos + self.height // 2 - text_h // 2)
 
     def move(self, direction, screen_w, screen_h):
         """
@@ -62,7 +95,7 @@ class Button(Entity):
         """
         pass
 
-    def draw(self, screen, mouse_pos):
+    def draw(self, screen, mouse_pos, mouse_pressed):
         """
         Override of the base draw method in Entity.
         Draws the button on the screen and handles hover state
@@ -72,26 +105,29 @@ class Button(Entity):
             screen (pygame.Surface): The screen or surface where
                 the button is drawn.
             mouse_pos (tuple): The current position of the mouse cursor.
+            mouse_pressed (bool): Whether the left mouse button is currently
+                pressed, queried once per frame by the caller.
 
         Behavior:
             - Changes the button color to `hover_color` when the
                 mouse is over it.
-            - Executes the `action` when the button is clicked (mouse pressed).
+            - Executes the `action` when the button is clicked, only on the
+                frame the mouse button goes down.
+
+        Returns:
+            bool: True if the `action` was executed, False otherwise.
         """
-        if (self.x_pos < mouse_pos[0] < self.x_pos + self.width and
-                self.y_pos < mouse_pos[1] < self.y_pos + self.height):
-            pygame.draw.rect(screen, self.hover_color,
-                             (self.x_pos, self.y_pos, self.width, self.height))
-
-            if pygame.mouse.get_pressed()[0] == 1 and self.action:
-                self.action()
-        else:
-            pygame.draw.rect(screen, self.color, (self.x_pos, self.y_pos,
-                                                  self.width, self.height))
-        # Render and center the text within the button
-        button_text = self.font.render(self.text, True, WHITE)
-        screen.blit(button_text, (self.x_pos +
-                                  (self.width // 2 -
-                                   button_text.get_width() // 2), self.y_pos +
-                                  (self.height // 2 -
-                                   button_text.get_height() // 2)))
+        is_clicked = mouse_pressed and not self._was_pressed
+        self._was_pressed = mouse_pressed
+
+        is_hovered = self._rect.collidepoint(mouse_pos)
+        pygame.draw.rect(screen, self._colors[is_hovered], self._rect)
+
+        is_run = bool(is_hovered and is_clicked and self.action)
+        if is_run:
+            self.action()
+
+        # Blit the pre-rendered text centered within the button
+        screen.blit(self._text_surf, self._text_offset)
+
+        return is_run
@@ -0,0 +1,10 @@
+import pygame
+
+# Named colors shared by all modules. pygame.Color objects are passed to
+# pygame as they are, without converting a tuple on every draw call.
+WHITE = pygame.Color(255, 255, 255)
+RED = pygame.Color(255, 0, 0)
+GREEN = pygame.Color(0, 255, 0)
+BLUE = pygame.Color(0, 0, 255)
+BLACK = pygame.Color(0, 0, 0)
+DARK_GRAY = pygame.Color(50, 50, 50)
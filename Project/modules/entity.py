@@ -1,16 +1,126 @@
 import os
-from abc import ABC, abstractmethod
 
 import pygame
 
-pygame.init()
+from .colors import WHITE
 
-WHITE = (255, 255, 255)
+# pygame-ce provides Surface.fblits, a faster batched blit without return
+# rects. Legacy pygame falls back to Surface.blits.
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
 
+# Image formats that can be used for entities.
+_IMAGE_EXTENSIONS = frozenset((".png", ".jpg", ".jpeg"))
+# Images shared by all entities, keyed by (image_path, width, height), or by
+# (color, width, height) for filled images.
+_IMAGE_CACHE = {}
+# Image paths that have already been found on disk.
+_EXISTING_PATHS = set()
 
-class Entity(ABC):
+
+def load_image(image_path, width, height):
+    """
+    Loads and scales an image, reusing the result for later entities.
+
+    Args:
+        image_path (str): The file path to the image.
+        width (int): The width the image is scaled to.
+        height (int): The height the image is scaled to.
+
+    Behavior:
+        - The image is converted to the pixel format of the display. If no
+            display mode has been set yet, the image is returned without
+            being converted and isn't cached, so it is loaded and converted
+            again once there is a display.
+
+    Returns:
+        pygame.Surface: The scaled image. The same surface is shared by all
+            entities that use the same path and size.
+    """
+    key = (image_path, width, height)
+    image = _IMAGE_CACHE.get(key)
+
+    if image is None:
+        image = pygame.image.load(image_path)
+        # convert_alpha needs a display mode to know the target format.
+        if pygame.display.get_surface() is None:
+            return pygame.transform.scale(image, (width, height))
+
+        image = pygame.transform.scale(image.convert_alpha(), (width, height))
+        _IMAGE_CACHE[key] = image
+
+    return image
+
+
+def preload_images(image_sizes):
+    """
+    Loads and scales images ahead of time, so that no image has to be
+        decoded from disk while the game is running.
+
+    Args:
+        image_sizes (iterable): (image_path, width, height) tuples of the
+            images and the sizes they are drawn at.
+
+    Behavior:
+        - Images that can't be loaded are skipped with a warning. Entities
+            using them will report the problem again when created.
     """
-    Abstract base class representing a generic entity in the game.
+    for image_path, width, height in image_sizes:
+        try:
+            load_image(image_path, width, height)
+        except pygame.error as e:
+            print("Pygame error:", e)
+        except Exception as e:
+            print("Unexpected error:", e)
+
+
+def load_filled_image(width, height, color):
+    """
+    Creates a surface filled with a single color, reusing it for later
+        entities of the same size and color.
+
+    Args:
+        width (int): The width of the surface.
+        height (int): The height of the surface.
+        color (tuple): The color the surface is filled with.
+
+    Returns:
+        pygame.Surface: The filled surface in the pixel format of the
+            display, shared by all entities that use the same size and color.
+    """
+    key = (tuple(color), width, height)
+    image = _IMAGE_CACHE.get(key)
+
+    if image is None:
+        image = pygame.Surface((width, height)).convert()
+        image.fill(color)
+        _IMAGE_CACHE[key] = image
+
+    return image
+
+
+def blit_batch(screen, blit_sequence):
+    """
+    Draws many surfaces onto the screen with a single call.
+
+    Args:
+        screen (pygame.Surface): The surface where everything is drawn.
+        blit_sequence (list): A list of (surface, destination) tuples.
+
+    Behavior:
+        - Uses `Surface.fblits` when running on pygame-ce, otherwise
+            `Surface.blits` without collecting the returned rectangles.
+    """
+    if _HAS_FBLITS:
+        screen.fblits(blit_sequence)
+    else:
+        screen.blits(blit_sequence, doreturn=False)
+
+
+class Entity:
+    """
+    Base class representing a generic entity in the game.
+
+    Every derived class has to implement the `move` method.
 
     Attributes:
         width (int): The width of the entity.
@@ -23,8 +133,12 @@ class Entity(ABC):
         image (pygame.Surface): The loaded image for the
             entity (if applicable).
         placeholder (pygame.Rect): A placeholder rectangle for positioning
-            the image.
+            the entity. Entities without an image get one with their
+            position and size.
     """
+    __slots__ = ('width', 'height', 'x_pos', 'y_pos', 'speed', 'has_image',
+                 'image', 'placeholder')
+
     def __init__(self, width, height, x_pos, y_pos, speed, image_path):
         """
         Initializes the base Entity instance with size, position,
@@ -47,6 +161,8 @@ class Entity(ABC):
                 image if provided.
             - `has_image` is initialized to False and updated if a valid
                 image is found.
+            - Entities without an image get an integer placeholder rectangle
+                at their position.
         """
         self.width = width
         self.height = height
@@ -58,6 +174,9 @@ class Entity(ABC):
         self.speed = speed
         self.has_image = False
         self.check_imagePath(image_path)
+        if not self.has_image:
+            self.placeholder = pygame.Rect(self.x_pos, self.y_pos,
+                                           self.width, self.height)
 
     def check_imagePath(self, image_path):
         """
@@ -69,9 +188,9 @@ class Entity(ABC):
         Behavior:
             - Skips image loading if 'N/A' is passed as the image path.
             - Checks if the file extension is supported (PNG, JPG, JPEG).
-            - Verifies the existence of the file on disk.
-            - If valid, the image is loaded, scaled, and a placeholder
-                rectangle is created.
+            - Verifies the existence of the file on disk, once per path.
+            - If valid, the scaled image is taken from the image cache, and
+                a placeholder rectangle is created.
             - Sets `has_image` to True if the image is successfully loaded.
             - Prints warnings if the image path is invalid, unsupported,
                 or the file is not found.
@@ -84,20 +203,20 @@ class Entity(ABC):
             # Exception handling in case of an invalid path or
             # unsupported format.
             try:
-                if image_path.lower().endswith((".png", ".jpg", ".jpeg")):
-                    if os.path.exists(image_path):
-                        self.image = pygame.image.load(
-                            image_path).convert_alpha()
-                        self.image = pygame.transform.scale(self.image,
-                                                            (self.width,
-                                                             self.height))
+                extension = os.path.splitext(image_path)[1].lower()
+                if extension in _IMAGE_EXTENSIONS:
+                    if (image_path in _EXISTING_PATHS or
+                            os.path.exists(image_path)):
+                        _EXISTING_PATHS.add(image_path)
+                        self.image = load_image(image_path, self.width,
+                                                self.height)
                         self.placeholder = self.image.get_rect(
                                 center=(self.x_pos, self.y_pos)
                             )
                         self.has_image = True
                         # Resetting the x and y to be the upper-left corner.
-                        self.x_pos -= self.width / 2
-                        self.y_pos -= self.height / 2
+                        self.x_pos -= self.width // 2
+                        self.y_pos -= self.height // 2
                     else:
                         print("Warning: The file", image_path,
                               "does not exist.")
@@ -109,27 +228,32 @@ class Entity(ABC):
             except Exception as e:
                 print("Unexpected error:", e)
 
-    @abstractmethod
     def move(self, direction, screen_w, screen_h):
-        """Abstract method to move the entity."""
-        pass
+        """Method to move the entity, implemented by every derived class."""
+        raise NotImplementedError
 
-    def draw(self, screen):
+    def draw(self, draw_batch):
         """
-        Draws the entity on the provided screen surface.
+        Adds the entity to the frame's batch of blits.
 
         Args:
-            screen (pygame.Surface): The surface where the entity
-                will be drawn.
+            draw_batch (list): The (surface, position) tuples drawn onto the
+                screen with a single `blit_batch` call at the end of the frame.
 
         Behavior:
             - If `has_image` is True, the image is drawn using the
                 placeholder rectangle.
             - If `has_image` is False, a white rectangle representing
-                the entity is drawn.
+                the entity is drawn at the placeholder rectangle.
+
+        Returns:
+            pygame.Rect: A copy of the placeholder rectangle, used to update
+                only the changed parts of the screen.
         """
         if self.has_image:
-            screen.blit(self.image, self.placeholder)
+            draw_batch.append((self.image, self.placeholder))
         else:
-            pygame.draw.rect(screen, WHITE,
-                             (self.x_pos, self.y_pos, self.width, self.height))
+            draw_batch.append((load_filled_image(self.width, self.height,
+                                                 WHITE), self.placeholder))
+
+        return self.placeholder.copy()
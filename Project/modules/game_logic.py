@@ -1,15 +1,21 @@
-import copy
+import functools
+import heapq
 import os
 import random
+import struct
 import sys
 
 import pygame
 
 from .spaceship import Spaceship
 from .bullet import Bullet
+from .bullet_pool import BulletPool
+from .alien_pool import AlienPool
 from .heart import Heart
 from .button import Button
 from .input_field import InputField
+from .entity import blit_batch, preload_images
+from .colors import WHITE, RED, GREEN, BLACK, DARK_GRAY
 
 pygame.init()
 pygame.mixer.init()
@@ -18,14 +24,44 @@ pygame.display.set_caption("Pixel Defender")
 SCREEN_W = 700
 SCREEN_H = 900
 SCREEN = pygame.display.set_mode((SCREEN_W, SCREEN_H))
-WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 0, 255)
-BLACK = (0, 0, 0)
-DARK_GRAY = (50, 50, 50)
 DEFAULT_FILE = 'scores/score-list.txt'
 CLOCK = pygame.time.Clock()
+# Fonts are created once, since SysFont looks up and opens the font file.
+# Fonts of the same size are shared, which also lets them share rendered
+# text surfaces.
+FONT_TITLE_80 = pygame.font.SysFont("Arial", 80)
+FONT_BUTTON_50 = pygame.font.SysFont("Arial", 50)
+FONT_TITLE_50 = FONT_BUTTON_50
+FONT_BUTTON_40 = pygame.font.SysFont("Arial", 40)
+FONT_TEXT_40 = FONT_BUTTON_40
+FONT_STATS_30 = pygame.font.SysFont("Arial", 30)
+FONT_PATH_25 = pygame.font.SysFont("Arial", 25)
+# Every image used by the game with the size it is drawn at.
+IMAGE_SIZES = (
+    ('raw/player.png', 130, 130),
+    ('raw/alien_small.png', 100, 100),
+    ('raw/alien_medium.png', 120, 120),
+    ('raw/alien_big.png', 150, 150),
+    ('raw/heart.png', 80, 80),
+)
+# A score record of a binary (.bin) score file: the length of the player's
+# name, the name as UTF-8 and the score.
+SCORE_NAME_LENGTH = struct.Struct('<H')
+SCORE_VALUE = struct.Struct('<i')
+# Scores parsed from every score file, keyed by path. Each entry holds the
+# (modification time, size) of the file when it was read and its scores.
+_SCORE_CACHE = {}
+# The three kinds of aliens as (size, speed, image_path, bullet damage,
+# shoot delay) tuples, from the smallest to the biggest.
+ALIEN_PRESETS = (
+    (100, 3, 'raw/alien_small.png', 10, 50),
+    (120, 1.5, 'raw/alien_medium.png', 25, 75),
+    (150, 0.75, 'raw/alien_big.png', 50, 100),
+)
+# Above this number of changed areas the whole frame is presented at once.
+MAX_DIRTY_RECTS = 50
+# The range of x-coordinates of each spawn zone of the aliens.
+SPAWN_RANGES = ((75, 175), (325, 375), (525, 625))
 
 
 def cap_fps():
@@ -37,6 +73,66 @@ def cap_fps():
     CLOCK.tick(60)
 
 
+def wait_for_events(is_dirty):
+    """
+    Waits for the next frame of a menu that has to be drawn.
+
+    A menu only changes after an event, or after one of its button actions
+    showed another menu and returned. Idle frames are neither redrawn nor
+    presented, but the frame rate is still capped while waiting.
+
+    Args:
+        is_dirty (bool): Whether the menu has to be drawn even without new
+            events, e.g. on its first frame or after a button action.
+
+    Returns:
+        list: The events of the frame that has to be drawn.
+    """
+    events = pygame.event.get()
+    while not events and not is_dirty:
+        cap_fps()
+        events = pygame.event.get()
+
+    return events
+
+
+def track_mouse(is_tracked):
+    """
+    Lets pygame queue mouse motion events or drop them.
+
+    Menus with buttons track the mouse, so the hover color of the buttons
+    follows it. The game is played with the keyboard, so there mouse motion
+    events are dropped by pygame instead of being queued and skipped every
+    frame.
+
+    Args:
+        is_tracked (bool): Whether mouse motion events are queued.
+    """
+    if is_tracked:
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+    else:
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+
+@functools.lru_cache(maxsize=512)
+def render_text(font, text, color):
+    """
+    Renders a text surface once for every font, text and color.
+
+    Args:
+        font (pygame.font.Font): The font object used to render the text.
+        text (str): The text of the surface.
+        color (tuple): The color of the text as an (r, g, b, a) tuple,
+            since pygame.Color can't be used as a cache key.
+
+    Returns:
+        pygame.Surface: A surface object containing the rendered text,
+            converted to the pixel format of the display. The same surface
+            is returned for repeated calls, so it must not be modified.
+    """
+    return font.render(text, True, color).convert_alpha()
+
+
 def get_surface(font, text, color):
     """
     Renders a text surface.
@@ -47,58 +143,77 @@ def get_surface(font, text, color):
         color (tuple): The color of the text.
 
     Returns:
-        pygame.Surface: A surface object containing the rendered text.
+        pygame.Surface: A surface object containing the rendered text,
+            cached by `render_text`.
     """
-    return font.render(text, True, color)
+    return render_text(font, str(text), tuple(color))
 
 
-def display_text(surface, x_pos, y_pos):
+def display_text(surface, x_pos, y_pos, draw_batch):
     """
     Displays any arbitrary text at a given position on the screen.
 
+    The text is added to the frame's batch of blits, which is drawn onto
+    the screen with a single `blit_batch` call before the display update.
+
     Args:
         surface (pygame.Surface): A rendered text surface.
         x_pos (int): The X-coordinate where the text will spawn.
         y_pos (int): The Y-coordinate where the text will spawn.
+        draw_batch (list): The (surface, position) tuples drawn this frame.
 
     Displays:
         Text at a given position on the screen.
     """
-    SCREEN.blit(surface, (x_pos, y_pos))
+    draw_batch.append((surface, (x_pos, y_pos)))
 
 
-def check_collisions(bullet, x_pos, y_pos, width, height):
+def center_text(surface, y_pos):
     """
-    Checks if a bullet has collided with an object based on its position.
+    Computes where a text surface is drawn to be centered horizontally on
+        the screen and vertically around a given height.
 
     Args:
-        bullet (Bullet): The bullet object whose position is being checked.
-        x_pos (int): The X-coordinate of the object to check against.
-        y_pos (int): The Y-coordinate of the object to check against.
-        width (int): The width of the object.
-        height (int): The height of the object.
+        surface (pygame.Surface): A rendered text surface.
+        y_pos (int): The Y-coordinate of the center of the text.
 
     Returns:
-        bool: True if the bullet has collided with the object, False otherwise.
+        tuple: A (surface, position) tuple, ready to be added to a batch
+            of blits.
     """
-    if (bullet.is_fired and y_pos <= bullet.y_pos <= y_pos + height and
-            x_pos <= bullet.x_pos <= x_pos + width):
-        return True
-    else:
-        return False
+    return (surface, (SCREEN_W // 2 - surface.get_width() // 2,
+                      y_pos - surface.get_height() // 2))
 
 
-def move_bullets(bullet, direction):
+def display_counter(prefix, digits, value, x_pos, y_pos, draw_batch):
     """
-    Moves and draws bullets if they have been fired.
+    Displays a label followed by a number, such as the score, at a given
+        position on the screen.
+
+    The number is put together from pre-rendered digits, so a changing
+    number never has to be rendered with the font.
 
     Args:
-        bullet (Bullet): The bullet object that will be moved and drawn.
-        direction (int): The direction in which the bullet should move.
+        prefix (pygame.Surface): The rendered label shown before the number.
+        digits (tuple): The rendered digits from 0 to 9, in the same font
+            and color as the label.
+        value (int): The non-negative number to be displayed.
+        x_pos (int): The X-coordinate where the label will spawn.
+        y_pos (int): The Y-coordinate where the label will spawn.
+        draw_batch (list): The (surface, position) tuples drawn this frame.
+
+    Returns:
+        pygame.Rect: The area covered by the label and the number.
     """
-    if bullet.is_fired:
-        bullet.move(direction, SCREEN_W, SCREEN_H)
-        bullet.draw(SCREEN)
+    draw_batch.append((prefix, (x_pos, y_pos)))
+    x = x_pos + prefix.get_width()
+
+    for char in str(value):
+        digit = digits[ord(char) - 48]
+        draw_batch.append((digit, (x, y_pos)))
+        x += digit.get_width()
+
+    return pygame.Rect(x_pos, y_pos, x - x_pos, prefix.get_height())
 
 
 def reset_bullets(bullet):
@@ -112,6 +227,7 @@ def reset_bullets(bullet):
     bullet.is_fired = False
     bullet.x_pos = SCREEN_W
     bullet.y_pos = SCREEN_H
+    bullet.placeholder.topleft = (SCREEN_W, SCREEN_H)
 
 
 def load_sound(path, volume):
@@ -133,91 +249,71 @@ def load_sound(path, volume):
     return sound
 
 
-def get_rand_spawn(location_list, rand_num):
+# The label of the score counter and the digits its number is made of.
+SCORE_PREFIX = get_surface(FONT_STATS_30, "Score: ", GREEN)
+SCORE_DIGITS = tuple(get_surface(FONT_STATS_30, digit, GREEN)
+                     for digit in "0123456789")
+# The health is always between 0 and 100, so the health counter is
+# rendered once for every value and indexed by the health.
+HEALTH_SURFACES = tuple(get_surface(FONT_STATS_30, f"Health: {health}", RED)
+                        for health in range(101))
+
+# Sounds are decoded once, instead of on every start of a game.
+SHOOT_SOUND = load_sound('raw/shoot.mp3', 0.5)
+HIT_SOUND = load_sound('raw/hit-taken.mp3', -1)
+KILL_SOUND = load_sound('raw/enemy-killed.mp3', 0.8)
+GAME_OVER_SOUND = load_sound('raw/game-over.mp3', 0.8)
+HEALTH_SOUND = load_sound('raw/health-pickup.mp3', 0.5)
+BACKGROUND_SONG = load_sound('raw/theme-song.mp3', -1)
+# The game event sounds are played on reserved channels, so the mixer
+# doesn't have to look for a free channel every time. A sound played again
+# on its channel restarts it instead of taking another channel. The other
+# sounds keep the 8 channels they had before.
+pygame.mixer.set_num_channels(12)
+pygame.mixer.set_reserved(4)
+HIT_CHANNEL = pygame.mixer.Channel(0)
+KILL_CHANNEL = pygame.mixer.Channel(1)
+HEALTH_CHANNEL = pygame.mixer.Channel(2)
+GAME_OVER_CHANNEL = pygame.mixer.Channel(3)
+
+
+def load_aliens(alien_pool):
     """
-    Generates a random spawn location for an object and ensures it doesn't
-    overlap with the previous spawn location.
+    Loads two alien spaceships into the alien_pool at random spawn
+    locations. Each alien can be one of three types with different
+    attributes.
 
     Args:
-        location_list (dict): A dictionary containing the previous spawn
-            location and the new spawn location.
-        rand_num (int): A random number (1, 2, or 3) representing
-            a potential spawn zone.
-
-    The function modifies the 'spawn_location' and 'previous_location' in the
-    location_list to ensure that two consecutive objects don't spawn in
-    the same location.
+        alien_pool (AlienPool): The pool to which the alien spaceship
+        instances will be added, together with their bullets.
+
+    Behavior:
+        - The types of both aliens are drawn with a single call, and so are
+            their spawn zones. The zones are drawn without replacement, so
+            the two aliens never spawn in the same location.
+        - The aliens get the bullets of killed aliens when there are any,
+            and new bullets otherwise.
     """
+    presets = random.choices(ALIEN_PRESETS, k=2)
+    spawn_ranges = random.sample(SPAWN_RANGES, 2)
 
-    # It check for previous location.
-    if location_list['previous_location'] == 0:
-        location_list['previous_location'] = rand_num
-
-        # The spawn location is set between on of these 3.
-        if rand_num == 1:
-            location_list['spawn_location'] = random.randint(75, 175)
-        elif rand_num == 2:
-            location_list['spawn_location'] = random.randint(325, 375)
-        elif rand_num == 3:
-            location_list['spawn_location'] = random.randint(525, 625)
-
-    # If there is a previous location it recursively gets a different one.
-    elif (location_list['previous_location'] >= 1 and
-            location_list['previous_location'] <= 3):
-        locations = [1, 2, 3]
-        locations.remove(location_list['previous_location'])
-        location_list['previous_location'] = 0
-        get_rand_spawn(location_list,
-                       random.choice([locations[0], locations[1]]))
-
-
-def load_aliens(alien_list):
-    """
-    Loads a specified number of alien spaceships into the alien_list
-    at random spawn locations. Each alien can be one of three types
-    with different attributes.
-
-    Args:
-        alien_list (list): The list to which the alien spaceship instances
-        will be appended.
-    """
-
-    # A dictionary with previous locations.
-    rand_location = {"spawn_location": 0, "previous_location": 0}
-
-    for i in range(0, 2):
-        alien_type = random.randint(1, 3)
-
-        get_rand_spawn(rand_location, random.randint(1, 3))
-
-        if alien_type == 1:
-            alien_list.append(copy.copy(Spaceship(100, 100,
-                                        rand_location['spawn_location'],
-                                        -1, 3, 'raw/alien_small.png', 1,
-                                        Bullet(5, 20, 0, 0, 30, 'N/A', 10),
-                                        50, False)))
-        elif alien_type == 2:
-            alien_list.append(copy.copy(Spaceship(120, 120,
-                                        rand_location['spawn_location'],
-                                        -1, 1.5, 'raw/alien_medium.png', 1,
-                                        Bullet(5, 20, 0, 0, 30, 'N/A', 25),
-                                        75, False)))
-        elif alien_type == 3:
-            alien_list.append(copy.copy(Spaceship(150, 150,
-                                        rand_location['spawn_location'],
-                                        -1, 0.75, 'raw/alien_big.png', 1,
-                                        Bullet(5, 20, 0, 0, 30, 'N/A', 50),
-                                        100, False)))
+    for preset, (low, high) in zip(presets, spawn_ranges):
+        size, speed, image_path, damage, shoot_delay = preset
+        spawn_x = random.randint(low, high)
+        bullet = (alien_pool.reuse_bullet(damage) or
+                  Bullet(5, 20, 0, 0, 30, 'N/A', damage))
+        alien_pool.add(Spaceship(size, size, spawn_x, -1, speed,
+                                 image_path, 1, bullet, shoot_delay, False))
 
 
 def get_heart():
     """
-    Creates and returns a copy of a Heart object.
+    Creates and returns a new Heart object.
 
     Returns:
         Heart: A new Heart object with predefined attributes.
     """
-    return copy.copy(Heart(80, 80, 350, -1, 1, 'raw/heart.png', 30))
+    return Heart(80, 80, 350, -1, 1, 'raw/heart.png', 30)
 
 
 def quit_game():
@@ -245,8 +341,8 @@ def check_file_path(path):
         path (str): The file path to be validated.
 
     Returns:
-        bool: True if the file exists and has a valid text format,
-              False otherwise.
+        bool: True if the file exists and is a text (.txt) or binary (.bin)
+              score file, False otherwise.
     """
     res = False
 
@@ -256,14 +352,14 @@ def check_file_path(path):
         # Exception handling in case of an invalid path or
         # unsupported format.
         try:
-            if path.lower().endswith((".txt")):
+            if path.lower().endswith((".txt", ".bin")):
                 if os.path.exists(path):
                     res = True
                 else:
                     print("Warning: The file", path, "does not exist.")
             else:
                 print("Warning: The file", path,
-                      "does not have a supported text format.")
+                      "does not have a supported score format.")
         except pygame.error as e:
             print("Pygame error:", e)
         except Exception as e:
@@ -281,6 +377,10 @@ def write_scores(name, path, score):
         path (str): The file path where the score will be written.
         score (int): The score to be recorded.
 
+    Behavior:
+        - Binary (.bin) files get a record of the name's length, the name
+            and the score, any other file gets a "name - Score: score" line.
+
     Returns:
         bool: True if the score was successfully written, False otherwise.
     """
@@ -288,8 +388,14 @@ def write_scores(name, path, score):
 
     # Exception handling in case of an error with writing.
     try:
-        with open(path, 'a') as file:
-            file.write(f"{name} - Score: {score}\n")
+        if path.lower().endswith(".bin"):
+            name = name.encode('utf-8')
+            with open(path, 'ab') as file:
+                file.write(struct.pack(f'<H{len(name)}si', len(name), name,
+                                       score))
+        else:
+            with open(path, 'a') as file:
+                file.write(f"{name} - Score: {score}\n")
         res = True
     except Exception as e:
         print("Unexpected error:", e)
@@ -297,12 +403,93 @@ def write_scores(name, path, score):
     return res
 
 
+def read_text_scores(path):
+    """
+    Parses the scores of a text score file.
+
+    Args:
+        path (str): The file path the scores are read from.
+
+    Behavior:
+        - Lines that don't have the "name - Score: score" format are skipped.
+
+    Returns:
+        list: The (line, score) tuples of the file.
+    """
+    scores = []
+    with open(path, 'r') as file:
+        # The file is read line by line, so it never has to be held in
+        # memory as a whole.
+        for line in file:
+            if ": " not in line:
+                continue
+
+            line = line.strip()
+            parts = line.split(": ")
+
+            if len(parts) == 2:
+                # Lines without a valid score are skipped.
+                try:
+                    score = int(parts[1].strip())
+                except ValueError:
+                    continue
+                scores.append((line, score))
+
+    return scores
+
+
+def read_binary_scores(path):
+    """
+    Parses the scores of a binary score file.
+
+    Args:
+        path (str): The file path the scores are read from.
+
+    Behavior:
+        - The file is read with a single call and the records are decoded
+            in place with `unpack_from`, without parsing any text.
+        - An incomplete record at the end of the file is skipped.
+
+    Returns:
+        list: The (line, score) tuples of the file, where line has the same
+            "name - Score: score" format as the lines of a text file.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    scores = []
+    offset = 0
+    header_size = SCORE_NAME_LENGTH.size
+    record_size = header_size + SCORE_VALUE.size
+    while offset + record_size <= len(data):
+        (length,) = SCORE_NAME_LENGTH.unpack_from(data, offset)
+        start = offset + header_size
+        end = start + length
+        if end + SCORE_VALUE.size > len(data):
+            break
+
+        name = data[start:end].decode('utf-8', 'replace')
+        (score,) = SCORE_VALUE.unpack_from(data, end)
+        scores.append((f"{name} - Score: {score}", score))
+        offset = end + SCORE_VALUE.size
+
+    return scores
+
+
 def read_scores(score_list, path):
     """
     Reads scores from the default score file and populates the score_list.
 
     Args:
         score_list (list): The list to which the read scores will be appended.
+        path (str): The file path the scores are read from.
+
+    Behavior:
+        - Binary (.bin) files are read with `read_binary_scores`, any other
+            file with `read_text_scores`.
+        - The parsed scores of every file are kept in memory, and reused
+            as long as the modification time and size of the file stay
+            the same.
 
     Returns:
         bool: True if the scores were successfully read, False otherwise.
@@ -311,16 +498,22 @@ def read_scores(score_list, path):
 
     # Exception handling in case of an error with reading.
     try:
-        with open(path, 'r') as file:
-            lines = file.readlines()
-            for line in lines:
-                line = line.strip()
-                parts = line.split(": ")
-
-                if len(parts) == 2:
-                    score = int(parts[1].strip())
-                    score_list.append((line, score))
+        # A file that hasn't changed since it was last read isn't parsed
+        # again.
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _SCORE_CACHE.get(path)
+        if cached is not None and cached[0] == version:
+            score_list.extend(cached[1])
+            return True
+
+        if path.lower().endswith(".bin"):
+            scores = read_binary_scores(path)
+        else:
+            scores = read_text_scores(path)
 
+        _SCORE_CACHE[path] = (version, scores)
+        score_list.extend(scores)
         res = True
     except Exception as e:
         print("Unexpected error:", e)
@@ -343,38 +536,41 @@ def main_menu():
     Returns:
         None
     """
-    font_button = pygame.font.SysFont("Arial", 50)
-    font_title = pygame.font.SysFont("Arial", 80)
 
-    title_surface = get_surface(font_title, "Pixel Defender", WHITE)
+    title_surface = get_surface(FONT_TITLE_80, "Pixel Defender", WHITE)
 
     play_bt = Button(200, 80, SCREEN_W // 2 - 100, SCREEN_H // 2, 0, 'N/A',
-                     "Play", font_button, BLACK, DARK_GRAY, play_game)
+                     "Play", FONT_BUTTON_50, BLACK, DARK_GRAY, play_game)
     scores_bt = Button(300, 80, SCREEN_W // 2 - 150, SCREEN_H // 2 + 125, 0,
-                       'N/A', "High Scores", font_button, BLACK, DARK_GRAY,
+                       'N/A', "High Scores", FONT_BUTTON_50, BLACK, DARK_GRAY,
                        input_file_menu)
     quit_bt = Button(200, 80, SCREEN_W // 2 - 100, SCREEN_H // 2 + 250, 0,
-                     'N/A', "Quit", font_button, BLACK, DARK_GRAY, quit_game)
+                     'N/A', "Quit", FONT_BUTTON_50, BLACK, DARK_GRAY,
+                     quit_game)
+
+    # The labels never change, so their positions are computed only once.
+    static_batch = [center_text(title_surface, 300)]
+
+    track_mouse(True)
 
     running = True
+    is_dirty = True
     while running:
-        for event in pygame.event.get():
+        for event in wait_for_events(is_dirty):
             if event.type == pygame.QUIT:
                 running = False
 
         SCREEN.fill(BLACK)
         mouse_pos = pygame.mouse.get_pos()
+        mouse_pressed = pygame.mouse.get_pressed()[0]
 
-        display_text(
-                title_surface,
-                SCREEN_W // 2 - title_surface.get_width() // 2,
-                300 - title_surface.get_height() // 2
-            )
-
-        play_bt.draw(SCREEN, mouse_pos)
-        scores_bt.draw(SCREEN, mouse_pos)
-        quit_bt.draw(SCREEN, mouse_pos)
+        is_dirty = any([
+            play_bt.draw(SCREEN, mouse_pos, mouse_pressed),
+            scores_bt.draw(SCREEN, mouse_pos, mouse_pressed),
+            quit_bt.draw(SCREEN, mouse_pos, mouse_pressed)
+        ])
 
+        blit_batch(SCREEN, static_batch)
         pygame.display.flip()
         cap_fps()
 
@@ -393,48 +589,43 @@ def pause_menu():
     and checks for user input. When the player resumes the game, the
     function will return; if they quit, the game will terminate.
 
-    It uses the Button class for the quit button and the display_text
+    It uses the Button class for the quit button and the center_text
     function to show text on the screen.
 
     Returns:
         None
     """
-    font_button = pygame.font.SysFont("Arial", 40)
-    font_title = pygame.font.SysFont("Arial", 50)
 
-    title_surface = get_surface(font_title, "Paused", WHITE)
-    resume_surface = get_surface(font_button, "Resume (SPACE)", WHITE)
+    title_surface = get_surface(FONT_TITLE_50, "Paused", WHITE)
+    resume_surface = get_surface(FONT_BUTTON_40, "Resume (SPACE)", WHITE)
 
     quit_bt = Button(200, 80, SCREEN_W // 2 - 100, SCREEN_H // 2 + 120, 0,
-                     'N/A', "Quit", font_button, BLACK, DARK_GRAY, quit_game)
+                     'N/A', "Quit", FONT_BUTTON_40, BLACK, DARK_GRAY,
+                     quit_game)
+
+    # The labels never change, so their positions are computed only once.
+    static_batch = [center_text(title_surface, 300),
+                    center_text(resume_surface, SCREEN_H // 2)]
+
+    track_mouse(True)
 
     running = True
+    is_dirty = True
     while running:
-        for event in pygame.event.get():
+        for event in wait_for_events(is_dirty):
             if event.type == pygame.QUIT:
                 running = False
+            elif (event.type == pygame.KEYDOWN and
+                    event.key == pygame.K_SPACE):
+                return
 
         SCREEN.fill(BLACK)
         mouse_pos = pygame.mouse.get_pos()
+        mouse_pressed = pygame.mouse.get_pressed()[0]
 
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_SPACE]:
-            return
-
-        display_text(
-            title_surface,
-            SCREEN_W // 2 - title_surface.get_width() // 2,
-            300 - title_surface.get_height() // 2
-        )
-
-        display_text(
-            resume_surface,
-            SCREEN_W // 2 - resume_surface.get_width() // 2,
-            SCREEN_H // 2 - resume_surface.get_height() // 2
-        )
-
-        quit_bt.draw(SCREEN, mouse_pos)
+        is_dirty = quit_bt.draw(SCREEN, mouse_pos, mouse_pressed)
 
+        blit_batch(SCREEN, static_batch)
         pygame.display.flip()
         cap_fps()
 
@@ -455,47 +646,55 @@ def game_over_menu(text, score, draw_score=None, draw_health=None):
             game is over.
         score (int): The score achieved by the player, to be saved
             if requested.
-        draw_score (function, optional): A function to draw the score on
-            the screen. Defaults to None.
-        draw_health (function, optional): A function to draw the player's
-            health on the screen. Defaults to None.
+        draw_score (function, optional): A function that adds the score to
+            the frame's batch of blits it is given. Defaults to None.
+        draw_health (function, optional): A function that adds the player's
+            health to the frame's batch of blits it is given.
+            Defaults to None.
 
     Returns:
         None
     """
-    font_button = pygame.font.SysFont("Arial", 40)
-    font_title = pygame.font.SysFont("Arial", 50)
 
-    title_surface = get_surface(font_title, text, WHITE)
+    title_surface = get_surface(FONT_TITLE_50, text, WHITE)
 
     save_score_bt = Button(200, 80, SCREEN_W // 2 - 100, SCREEN_H // 2, 0,
-                           'N/A', "Save Score", font_button, BLACK, DARK_GRAY,
+                           'N/A', "Save Score", FONT_BUTTON_40, BLACK,
+                           DARK_GRAY,
                            lambda: save_score_menu(score))
     retry_bt = Button(200, 80, SCREEN_W // 2 - 100, SCREEN_H // 2 + 120, 0,
-                      'N/A', "Retry", font_button, BLACK, DARK_GRAY, play_game)
+                      'N/A', "Retry", FONT_BUTTON_40, BLACK, DARK_GRAY,
+                      play_game)
     quit_bt = Button(200, 80, SCREEN_W // 2 - 100, SCREEN_H // 2 + 240, 0,
-                     'N/A', "Quit", font_button, BLACK, DARK_GRAY, quit_game)
+                     'N/A', "Quit", FONT_BUTTON_40, BLACK, DARK_GRAY,
+                     quit_game)
+
+    # The title never changes, so its position is computed only once.
+    static_batch = [center_text(title_surface, 300)]
+
+    track_mouse(True)
+
     running = True
+    is_dirty = True
     while running:
-        for event in pygame.event.get():
+        for event in wait_for_events(is_dirty):
             if event.type == pygame.QUIT:
                 running = False
 
         SCREEN.fill(BLACK)
+        draw_batch = static_batch.copy()
         mouse_pos = pygame.mouse.get_pos()
+        mouse_pressed = pygame.mouse.get_pressed()[0]
 
-        display_text(
-                title_surface,
-                SCREEN_W // 2 - title_surface.get_width() // 2,
-                300 - title_surface.get_height() // 2
-            )
-
-        save_score_bt.draw(SCREEN, mouse_pos)
-        retry_bt.draw(SCREEN, mouse_pos)
-        quit_bt.draw(SCREEN, mouse_pos)
-        draw_score()
-        draw_health()
+        is_dirty = any([
+            save_score_bt.draw(SCREEN, mouse_pos, mouse_pressed),
+            retry_bt.draw(SCREEN, mouse_pos, mouse_pressed),
+            quit_bt.draw(SCREEN, mouse_pos, mouse_pressed)
+        ])
+        draw_score(draw_batch)
+        draw_health(draw_batch)
 
+        blit_batch(SCREEN, draw_batch)
         pygame.display.flip()
         cap_fps()
 
@@ -517,8 +716,6 @@ def save_score_menu(score):
     Returns:
         None
     """
-    font_text = pygame.font.SysFont("Arial", 40)
-    font_path = pygame.font.SysFont("Arial", 25)
 
     text = "Save (s)"
     name = "Player"
@@ -526,77 +723,63 @@ def save_score_menu(score):
 
     is_saved = False
 
-    save_surface = get_surface(font_text, text, WHITE)
-    return_surface = get_surface(font_text, "Go back (b)", WHITE)
-    name_surface = get_surface(font_text, "Name", WHITE)
-    path_surface = get_surface(font_text, "File path (optional)", WHITE)
+    save_surface = get_surface(FONT_TEXT_40, text, WHITE)
+    return_surface = get_surface(FONT_TEXT_40, "Go back (b)", WHITE)
+    name_surface = get_surface(FONT_TEXT_40, "Name", WHITE)
+    path_surface = get_surface(FONT_TEXT_40, "File path (optional)", WHITE)
 
     name_field = InputField(350, 50, SCREEN_W // 2 - 175, SCREEN_H // 2, 0,
-                            'N/A', font_text, WHITE, DARK_GRAY)
+                            'N/A', FONT_TEXT_40, WHITE, DARK_GRAY)
     path_field = InputField(680, 35, SCREEN_W // 2 - 340, SCREEN_H // 2 + 180,
-                            0, 'N/A', font_path, WHITE, DARK_GRAY)
+                            0, 'N/A', FONT_PATH_25, WHITE, DARK_GRAY)
+
+    # The positions of the labels are computed only once. The save label
+    # is the first one, and is replaced when its text changes.
+    static_batch = [center_text(save_surface, 200),
+                    center_text(return_surface, 300),
+                    center_text(name_surface, 420),
+                    center_text(path_surface, 600)]
 
     running = True
+    is_dirty = True
     while running:
-        for event in pygame.event.get():
+        for event in wait_for_events(is_dirty):
             if event.type == pygame.QUIT:
                 running = False
             res_name = name_field.handle_event(event)
             if res_name is not None:
-                name = res_name
+                name = res_name or "Player"
             res_path = path_field.handle_event(event)
             if res_path is not None:
-                path = res_path
+                path = res_path or DEFAULT_FILE
 
-        SCREEN.fill(BLACK)
+            # Keys typed into an input field are not menu shortcuts.
+            if (event.type != pygame.KEYDOWN or name_field.is_active or
+                    path_field.is_active):
+                continue
 
-        if name == "":
-            name = "Player"
+            # A score is only written once, even if (s) is pressed again.
+            if event.key == pygame.K_s and not is_saved:
+                if check_file_path(path):
+                    if write_scores(name, path, score):
+                        text = "Score saved!"
+                        is_saved = True
+                    else:
+                        text = "Score NOT saved!"
+                else:
+                    text = "Invalid path!"
+                save_surface = get_surface(FONT_TEXT_40, text, WHITE)
+                static_batch[0] = center_text(save_surface, 200)
+            elif event.key == pygame.K_b:
+                return
 
-        if path == "":
-            path = DEFAULT_FILE
+        is_dirty = False
 
-        keys = pygame.key.get_pressed()
-        if (keys[pygame.K_s] and not is_saved and not name_field.is_active
-                and not path_field.is_active):
-            if check_file_path(path):
-                if write_scores(name, path, score):
-                    text = "Score saved!"
-                    save_surface = get_surface(font_text, text, WHITE)
-                    is_saved = True
-                else:
-                    text = "Score NOT saved!"
-                    save_surface = get_surface(font_text, text, WHITE)
-            else:
-                text = "Invalid path!"
-                save_surface = get_surface(font_text, text, WHITE)
-        if (keys[pygame.K_b] and not name_field.is_active and
-                not path_field.is_active):
-            return
-
-        display_text(
-                save_surface,
-                SCREEN_W // 2 - save_surface.get_width() // 2,
-                200 - save_surface.get_height() // 2
-            )
-        display_text(
-                return_surface,
-                SCREEN_W // 2 - return_surface.get_width() // 2,
-                300 - return_surface.get_height() // 2
-            )
-        display_text(
-                name_surface,
-                SCREEN_W // 2 - name_surface.get_width() // 2,
-                420 - name_surface.get_height() // 2
-            )
-        display_text(
-                path_surface,
-                SCREEN_W // 2 - path_surface.get_width() // 2,
-                600 - path_surface.get_height() // 2
-            )
+        SCREEN.fill(BLACK)
         name_field.draw(SCREEN)
         path_field.draw(SCREEN)
 
+        blit_batch(SCREEN, static_batch)
         pygame.display.flip()
         cap_fps()
 
@@ -626,83 +809,51 @@ def top_scores_menu(user_path="", is_user_given=False):
     Returns:
         None
     """
-    font_text = pygame.font.SysFont("Arial", 40)
     text = "Top 5 Scores"
 
     score_list = []
 
-    title_surface = get_surface(font_text, text, WHITE)
-    quit_surface = get_surface(font_text, "Go back (b)", WHITE)
+    title_surface = get_surface(FONT_TEXT_40, text, WHITE)
+    quit_surface = get_surface(FONT_TEXT_40, "Go back (b)", WHITE)
 
     if is_user_given:
         if not read_scores(score_list, user_path):
             text = "Error reading user file!"
-            title_surface = get_surface(font_text, text, WHITE)
+            title_surface = get_surface(FONT_TEXT_40, text, WHITE)
 
-    if read_scores(score_list, DEFAULT_FILE):
-        score_list.sort(key=lambda x: x[1], reverse=True)
-    else:
+    if not read_scores(score_list, DEFAULT_FILE):
         text = "Error reading file!"
-        title_surface = get_surface(font_text, text, WHITE)
+        title_surface = get_surface(FONT_TEXT_40, text, WHITE)
+
+    # Only the best 5 scores are shown, so the rest are never sorted.
+    score_list = heapq.nlargest(5, score_list, key=lambda x: x[1])
 
     if len(score_list) < 5:
         for i in range(len(score_list), 5):
             score_list.append(("___", 0))
 
-    score_1 = get_surface(font_text, score_list[0][0], WHITE)
-    score_2 = get_surface(font_text, score_list[1][0], WHITE)
-    score_3 = get_surface(font_text, score_list[2][0], WHITE)
-    score_4 = get_surface(font_text, score_list[3][0], WHITE)
-    score_5 = get_surface(font_text, score_list[4][0], WHITE)
+    # Nothing in this menu changes, so the whole batch is built only once.
+    static_batch = [center_text(title_surface, 150)]
+    for i, (line, _) in enumerate(score_list):
+        static_batch.append(
+                center_text(get_surface(FONT_TEXT_40, line, WHITE),
+                            300 + i * 75)
+            )
+    static_batch.append(center_text(quit_surface, 750))
 
     running = True
+    is_dirty = True
     while running:
-        for event in pygame.event.get():
+        for event in wait_for_events(is_dirty):
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_b:
+                return
 
-        SCREEN.fill(BLACK)
-
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_b]:
-            return
-
-        display_text(
-                title_surface,
-                SCREEN_W // 2 - title_surface.get_width() // 2,
-                150 - title_surface.get_height() // 2
-            )
-        display_text(
-                score_1,
-                SCREEN_W // 2 - score_1.get_width() // 2,
-                300 - score_1.get_height() // 2
-            )
-        display_text(
-                score_2,
-                SCREEN_W // 2 - score_2.get_width() // 2,
-                375 - score_2.get_height() // 2
-            )
-        display_text(
-                score_3,
-                SCREEN_W // 2 - score_3.get_width() // 2,
-                450 - score_3.get_height() // 2
-            )
-        display_text(
-                score_4,
-                SCREEN_W // 2 - score_4.get_width() // 2,
-                525 - score_4.get_height() // 2
-            )
-        display_text(
-                score_5,
-                SCREEN_W // 2 - score_5.get_width() // 2,
-                600 - score_5.get_height() // 2
-            )
-        display_text(
-                quit_surface,
-                SCREEN_W // 2 - quit_surface.get_width() // 2,
-                750 - quit_surface.get_height() // 2
-            )
+        is_dirty = False
 
+        SCREEN.fill(BLACK)
+        blit_batch(SCREEN, static_batch)
         pygame.display.flip()
         cap_fps()
 
@@ -725,70 +876,60 @@ def input_file_menu():
     Returns:
         None
     """
-    font_text = pygame.font.SysFont("Arial", 40)
-    font_path = pygame.font.SysFont("Arial", 25)
 
     text = "See scores (s)"
     path = None
 
-    proceed_surface = get_surface(font_text, text, WHITE)
-    return_surface = get_surface(font_text, "Go back (b)", WHITE)
-    path_surface = get_surface(font_text, "File path (optional)", WHITE)
-    info_surface = get_surface(font_path, "* To skip file input just press "
+    proceed_surface = get_surface(FONT_TEXT_40, text, WHITE)
+    return_surface = get_surface(FONT_TEXT_40, "Go back (b)", WHITE)
+    path_surface = get_surface(FONT_TEXT_40, "File path (optional)", WHITE)
+    info_surface = get_surface(FONT_PATH_25, "* To skip file input just press "
                                "(s) without typing anything *", WHITE)
 
     path_field = InputField(680, 35, SCREEN_W // 2 - 340, SCREEN_H // 2 + 100,
-                            0, 'N/A', font_path, WHITE, DARK_GRAY)
+                            0, 'N/A', FONT_PATH_25, WHITE, DARK_GRAY)
+
+    # The positions of the labels are computed only once. The proceed
+    # label is the first one, and is replaced when its text changes.
+    static_batch = [center_text(proceed_surface, 200),
+                    center_text(return_surface, 300),
+                    center_text(path_surface, 500),
+                    center_text(info_surface, 750)]
 
     running = True
+    is_dirty = True
     while running:
-        for event in pygame.event.get():
+        for event in wait_for_events(is_dirty):
             if event.type == pygame.QUIT:
                 running = False
             res_path = path_field.handle_event(event)
             if res_path is not None:
-                path = res_path
-
-        SCREEN.fill(BLACK)
+                path = res_path or None
+
+            # Keys typed into the input field are not menu shortcuts.
+            if event.type != pygame.KEYDOWN or path_field.is_active:
+                continue
+
+            if event.key == pygame.K_s:
+                if path is not None:
+                    if check_file_path(path):
+                        top_scores_menu(path, True)
+                    else:
+                        text = "Invalid path!"
+                        proceed_surface = get_surface(FONT_TEXT_40, text,
+                                                      WHITE)
+                        static_batch[0] = center_text(proceed_surface, 200)
+                else:
+                    top_scores_menu()
+            elif event.key == pygame.K_b:
+                return
 
-        if path == "":
-            path = None
+        is_dirty = False
 
-        keys = pygame.key.get_pressed()
-        if (keys[pygame.K_s] and not path_field.is_active):
-            if path is not None:
-                if check_file_path(path):
-                    top_scores_menu(path, True)
-                else:
-                    text = "Invalid path!"
-                    proceed_surface = get_surface(font_text, text, WHITE)
-            else:
-                top_scores_menu()
-        if (keys[pygame.K_b] and not path_field.is_active):
-            return
-
-        display_text(
-                proceed_surface,
-                SCREEN_W // 2 - proceed_surface.get_width() // 2,
-                200 - proceed_surface.get_height() // 2
-            )
-        display_text(
-                return_surface,
-                SCREEN_W // 2 - return_surface.get_width() // 2,
-                300 - return_surface.get_height() // 2
-            )
-        display_text(
-                path_surface,
-                SCREEN_W // 2 - path_surface.get_width() // 2,
-                500 - path_surface.get_height() // 2
-            )
-        display_text(
-                info_surface,
-                SCREEN_W // 2 - info_surface.get_width() // 2,
-                750 - info_surface.get_height() // 2
-            )
+        SCREEN.fill(BLACK)
         path_field.draw(SCREEN)
 
+        blit_batch(SCREEN, static_batch)
         pygame.display.flip()
         cap_fps()
 
@@ -810,172 +951,161 @@ def game_loop():
     player = Spaceship(130, 130, 350, 780, 10, 'raw/player.png', 100,
                        Bullet(5, 20, 0, 0, 30, 'N/A', 1), 0, True)
     heart = get_heart()
-    alien_list = []
+    player_bullets = BulletPool(-1)
+    player_bullets.add(player.bullet)
+    alien_bullets = BulletPool(1)
+    alien_pool = AlienPool(alien_bullets)
     score = 0
     goal = 10
     level = 1
 
-    font_stats = pygame.font.SysFont("Arial", 30)
-
-    health_surface = get_surface(font_stats, f"Health: {player.health}", RED)
-    score_surface = get_surface(font_stats, f"Score: {score}", GREEN)
-
     running = True
     is_game_over = False
+    # The first frame, and frames after another menu covered the screen,
+    # are cleared and presented in full. Other frames only erase and update
+    # the areas that were drawn in this or the previous frame.
+    is_full_redraw = True
+    previous_dirty = []
 
     game_over_text = "YOU DIED"
 
-    shoot_sound = load_sound('raw/shoot.mp3', 0.5)
-    hit_sound = load_sound('raw/hit-taken.mp3', -1)
-    kill_sound = load_sound('raw/enemy-killed.mp3', 0.8)
-    game_over_sound = load_sound('raw/game-over.mp3', 0.8)
-    health_sound = load_sound('raw/health-pickup.mp3', 0.5)
-    background_song = load_sound('raw/theme-song.mp3', -1)
-
-    background_song.play(-1)
+    track_mouse(False)
+    BACKGROUND_SONG.play(-1)
 
     while running:
         # Event handling
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-
-        SCREEN.fill(BLACK)
-        display_text(score_surface, 30, 850)
-        display_text(health_surface, 530, 850)
+            elif event.type == pygame.KEYDOWN and not is_game_over:
+                if event.key == pygame.K_p:
+                    BACKGROUND_SONG.stop()
+                    pause_menu()
+                    track_mouse(False)
+                    BACKGROUND_SONG.play(-1)
+                    is_full_redraw = True
+                elif (event.key == pygame.K_SPACE and
+                        not player.bullet.is_fired):
+                    player.shoot(SHOOT_SOUND)
+                    player_bullets.fire(player.bullet)
+
+        if is_full_redraw:
+            SCREEN.fill(BLACK)
+        else:
+            # Everything else on the screen is already black, so only the
+            # areas drawn in the previous frame have to be erased.
+            for rect in previous_dirty:
+                SCREEN.fill(BLACK, rect)
+        draw_batch = []
+        health_surface = HEALTH_SURFACES[player.health]
+        display_text(health_surface, 530, 850, draw_batch)
+        dirty = [
+            display_counter(SCORE_PREFIX, SCORE_DIGITS, score, 30, 850,
+                            draw_batch),
+            health_surface.get_rect(topleft=(530, 850))
+        ]
 
         if is_game_over:
             game_over_menu(
                 game_over_text,
                 score,
-                lambda: display_text(score_surface, 30, 850),
-                lambda: display_text(health_surface, 530, 850)
+                lambda batch: display_counter(SCORE_PREFIX, SCORE_DIGITS,
+                                              score, 30, 850, batch),
+                lambda batch: display_text(HEALTH_SURFACES[player.health],
+                                           530, 850, batch)
             )
         else:
-            # Player controls
+            # Player movement keeps going while the keys are held down.
+            # Pausing and shooting are handled once per key press above.
             keys = pygame.key.get_pressed()
             if keys[pygame.K_LEFT]:
                 player.move(-1, SCREEN_W, SCREEN_H)
             if keys[pygame.K_RIGHT]:
                 player.move(1, SCREEN_W, SCREEN_H)
-            if keys[pygame.K_p]:
-                background_song.stop()
-                pause_menu()
-                background_song.play(-1)
-            if keys[pygame.K_SPACE] and not player.bullet.is_fired:
-                player.shoot(shoot_sound)
 
             # Load a number aliens based on the current level
-            if len(alien_list) < level:
-                load_aliens(alien_list)
-
-            player.draw(SCREEN)
-
-            move_bullets(player.bullet, -1)
-
-            # Main loop that controls aliens
-            for alien in alien_list:
-                if not alien.is_killed:
-                    alien.move(1, SCREEN_W, SCREEN_H)
-
-                    # Check if the alien reaches the player
-                    if alien.is_killed:
-                        is_game_over = True
-                        game_over_text = "ALIENS REACHED YOU"
-                        player.health = 0
-                        health_surface = get_surface(
-                                font_stats,
-                                f"Health: {player.health}",
-                                RED
-                            )
-                        game_over_sound.play()
-                        background_song.stop()
-                        break
-
-                    alien.draw(SCREEN)
-
-                    # Alien shooting logic
-                    if not alien.bullet.is_fired:
-                        alien.alien_shoot(shoot_sound)
-
-                    move_bullets(alien.bullet, 1)
-
-                    # Check collisions with the player's bullet
-                    if (check_collisions(player.bullet, alien.x_pos,
-                                         alien.y_pos, alien.width,
-                                         alien.height)):
-                        alien.is_killed = True
-                        reset_bullets(player.bullet)
-                        score += 1
-
-                        if score % 25 == 0:
-                            level += 1
-
-                        score_surface = get_surface(
-                                font_stats,
-                                f"Score: {score}",
-                                GREEN
-                            )
-                        kill_sound.play()
-
-                    # Check collisions with the alien's bullet
-                    if (check_collisions(alien.bullet, player.x_pos,
-                                         player.y_pos, player.width,
-                                         player.height)):
-                        player.health -= alien.bullet.damage
-                        reset_bullets(alien.bullet)
-
-                        if player.health < 0:
-                            player.health = 0
-                        health_surface = get_surface(
-                                font_stats,
-                                f"Health: {player.health}",
-                                RED
-                            )
-
-                        hit_sound.play()
-
-                    # Remove killed aliens from the list
-                    if alien.is_killed:
-                        alien_list.remove(alien)
-                        del alien.bullet
-                        del alien
-
-                    # Check if player health is 0
-                    if player.health <= 0:
-                        is_game_over = True
-                        game_over_sound.play()
-                        background_song.stop()
-                        break
+            if len(alien_pool.aliens) < level:
+                load_aliens(alien_pool)
+
+            dirty.append(player.draw(draw_batch))
+
+            # Move, draw all aliens and let them shoot in a single pass,
+            # checking if an alien reaches the player
+            if alien_pool.step(SCREEN_W, SCREEN_H, SHOOT_SOUND, draw_batch,
+                               dirty):
+                is_game_over = True
+                game_over_text = "ALIENS REACHED YOU"
+                player.health = 0
+                GAME_OVER_CHANNEL.play(GAME_OVER_SOUND)
+                BACKGROUND_SONG.stop()
+
+            # Move all fired bullets and check collisions in the same pass
+            player_hits = player_bullets.step(SCREEN_W, SCREEN_H,
+                                              alien_pool.rects)
+            alien_hits = alien_bullets.step(SCREEN_W, SCREEN_H,
+                                            [player.placeholder])
+
+            # Hits no longer count once an alien has reached the player
+            if not is_game_over:
+                # Collisions of the player's bullet with aliens
+                for bullet, index in player_hits:
+                    alien_pool.aliens[index].is_killed = True
+                    reset_bullets(bullet)
+                    score += 1
+
+                    if score % 25 == 0:
+                        level += 1
+
+                    KILL_CHANNEL.play(KILL_SOUND)
+
+                # Collisions of the aliens' bullets with the player
+                for bullet, index in alien_hits:
+                    player.health = max(0, player.health - bullet.damage)
+                    reset_bullets(bullet)
+
+                    HIT_CHANNEL.play(HIT_SOUND)
+
+            # Add all fired bullets to the frame's batch
+            dirty.extend(player_bullets.draw(draw_batch))
+            dirty.extend(alien_bullets.draw(draw_batch))
+
+            # Remove killed aliens from the pool
+            alien_pool.remove_killed()
+
+            # Check if player health is 0
+            if player.health <= 0 and not is_game_over:
+                is_game_over = True
+                GAME_OVER_CHANNEL.play(GAME_OVER_SOUND)
+                BACKGROUND_SONG.stop()
 
             # Check if the score has reached the goal for health pickup
             if score >= goal:
                 if not heart.is_claimed:
                     heart.move(1, SCREEN_W, SCREEN_H)
-                    heart.draw(SCREEN)
+                    dirty.append(heart.draw(draw_batch))
 
                     # Check collisions with the player's bullet
-                    if (check_collisions(player.bullet, heart.x_pos,
-                                         heart.y_pos, heart.width,
-                                         heart.height)):
+                    if (player.bullet.is_fired and
+                            player.bullet.placeholder.colliderect(
+                                heart.placeholder)):
                         heart.is_claimed = True
-                        player.health += heart.restore_amount
+                        player.health = min(100, player.health +
+                                            heart.restore_amount)
                         reset_bullets(player.bullet)
                         goal += 10
-                        health_sound.play()
-
-                        if player.health > 100:
-                            player.health = 100
-                        health_surface = get_surface(
-                                font_stats,
-                                f"Health: {player.health}",
-                                RED
-                            )
+                        HEALTH_CHANNEL.play(HEALTH_SOUND)
                 else:
-                    del heart
                     heart = get_heart()
 
-        pygame.display.flip()
+        blit_batch(SCREEN, draw_batch)
+        update_rects = previous_dirty + dirty
+        # Many small updates cost more than presenting the whole frame.
+        if is_full_redraw or len(update_rects) > MAX_DIRTY_RECTS:
+            pygame.display.flip()
+            is_full_redraw = False
+        else:
+            pygame.display.update(update_rects)
+        previous_dirty = dirty
         cap_fps()
 
     quit_game()
@@ -992,6 +1122,9 @@ def start_game():
     to handle exiting the game.
 
     The game logic and flow are managed within these called functions.
+    Before that, all images are loaded once, so starting or retrying a game
+    doesn't decode them from disk.
     """
+    preload_images(IMAGE_SIZES)
     main_menu()
     quit_game()
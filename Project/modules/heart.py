@@ -13,6 +13,8 @@ class Heart(Entity):
         is_claimed (bool): Indicates whether the heart has been claimed
             or gone off-screen.
     """
+    __slots__ = ('restore_amount', 'is_claimed')
+
     def __init__(self, width, height, x_pos, y_pos, speed,
                  image_path, restore_amount):
         """
@@ -55,8 +57,10 @@ class Heart(Entity):
             - If the heart moves off the bottom of the screen, it is marked
                 as `is_claimed = True`, allowing it to be removed and replaced.
         """
-        self.y_pos += self.speed * direction
-        self.placeholder.y = self.y_pos
+        y_pos = self.y_pos + self.speed * direction
+        placeholder = self.placeholder
+        self.y_pos = y_pos
+        placeholder.y = y_pos
 
-        if self.placeholder.y >= screen_h + self.height:
+        if placeholder.y >= screen_h + self.height:
             self.is_claimed = True
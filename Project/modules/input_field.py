@@ -2,8 +2,6 @@ import pygame
 
 from .entity import Entity
 
-pygame.init()
-
 
 class InputField(Entity):
     """
@@ -22,9 +20,19 @@ class InputField(Entity):
             on whether it is active or inactive.
         is_active (bool): A flag indicating whether the input field
             is currently active (clicked and ready for input).
-        text (str): The current text inputted into the field.
+        text (str): The current text inputted into the field, joined from
+            `_chars`.
+        _chars (list): The characters typed into the field, so a key press
+            doesn't build a new string.
         rect (pygame.Rect): The rectangular area of the input field.
+        _text_key (tuple): The (text, color) of the last composed surface.
+        _surface (pygame.Surface): The text and the border of the field
+            composed into one surface, reused by `draw` as long as the text
+            and color stay the same.
     """
+    __slots__ = ('font', 'active_color', 'inactive_color', 'color',
+                 'is_active', '_chars', 'rect', '_text_key', '_surface')
+
     def __init__(self, width, height, x_pos, y_pos, speed, image_path,
                  font, active_color, inactive_color):
         """
@@ -54,8 +62,8 @@ class InputField(Entity):
                 based on the input field's state.
             is_active (bool): Initially set to False, indicating that the
                 input field is not active.
-            text (str): The text string that stores user input, initially
-                an empty string.
+            _chars (list): The characters of the user input, initially
+                an empty list.
             rect (pygame.Rect): A rectangle representing the size and position
                 of the input field for collision detection.
         """
@@ -65,9 +73,18 @@ class InputField(Entity):
         self.inactive_color = inactive_color
         self.color = self.inactive_color
         self.is_active = False
-        self.text = ""
+        self._chars = []
         self.rect = pygame.Rect(self.x_pos, self.y_pos, self.width,
                                 self.height)
+        self._text_key = None
+        self._surface = None
+
+    @property
+    def text(self):
+        """
+        str: The current text inputted into the field.
+        """
+        return "".join(self._chars)
 
     def move(self, direction, screen_w, screen_h):
         """
@@ -98,12 +115,30 @@ class InputField(Entity):
                 length of the text.
             - Draws a rectangle around the input field to indicate
                 its boundaries.
+            - The text and the rectangle are composed into one surface only
+                when the text or the color changed since the last draw.
+                Otherwise the field is drawn with a single blit.
         """
-        txt_surface = self.font.render(self.text, True, self.color)
-        width = max(self.rect.width, txt_surface.get_width() + 10)
-        self.rect.w = width
-        screen.blit(txt_surface, (self.rect.x + 5, self.rect.y + 5))
-        pygame.draw.rect(screen, self.color, self.rect, 2)
+        text = self.text
+        key = (text, self.color)
+        if key != self._text_key:
+            self._text_key = key
+            txt_surface = self.font.render(text, True, self.color)
+            # The field only grows, so a shorter text keeps its width.
+            width = txt_surface.get_width() + 10
+            if width > self.rect.w:
+                self.rect.w = width
+
+            # The text may reach below the border, as when it was drawn
+            # straight onto the screen.
+            height = max(self.rect.h, txt_surface.get_height() + 5)
+            surface = pygame.Surface((self.rect.w, height), pygame.SRCALPHA)
+            surface.blit(txt_surface, (5, 5))
+            pygame.draw.rect(surface, self.color,
+                             (0, 0, self.rect.w, self.rect.h), 2)
+            self._surface = surface
+
+        screen.blit(self._surface, self.rect.topleft)
 
     def handle_event(self, event):
         """
@@ -160,8 +195,9 @@ class InputField(Entity):
 
         if event.type == pygame.KEYDOWN and self.is_active:
             if event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]  # Remove the last character.
+                if self._chars:
+                    self._chars.pop()  # Remove the last character.
             else:
-                self.text += event.unicode  # Add the entered character.
+                self._chars.append(event.unicode)  # Add the entered character.
 
         return None
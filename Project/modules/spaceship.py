@@ -16,7 +16,13 @@ class Spaceship(Entity):
             has been destroyed.
         shoot_timer (int): A timer that counts up to the shoot delay to
             manage shooting intervals.
+        half_height (float): Half of the height of the spaceship.
+        bullet_offset (int): The horizontal distance from the left of the
+            spaceship to the left of a bullet fired from its middle.
     """
+    __slots__ = ('health', 'is_killed', 'bullet', 'shoot_delay', 'is_player',
+                 'shoot_timer', 'half_height', 'bullet_offset')
+
     def __init__(self, width, height, x_pos, y_pos, speed, image_path, health,
                  bullet, shoot_delay, is_player):
         """
@@ -42,6 +48,10 @@ class Spaceship(Entity):
         self.shoot_delay = shoot_delay
         self.is_player = is_player
         self.shoot_timer = 0
+        # Computed once, since they are needed every time the spaceship
+        # shoots or checks if it can shoot.
+        self.half_height = height / 2
+        self.bullet_offset = width // 2 - bullet.width // 2
 
     def shoot(self, sound):
         """
@@ -59,8 +69,7 @@ class Spaceship(Entity):
             y += self.height
 
         sound.play()
-        self.bullet.set_coordinates(self.placeholder.x + self.width / 2 -
-                                    self.bullet.width / 2, y)
+        self.bullet.set_coordinates(self.placeholder.x + self.bullet_offset, y)
 
     def alien_shoot(self, sound):
         """
@@ -72,13 +81,19 @@ class Spaceship(Entity):
 
         Args:
             sound (pygame.mixer.Sound): The sound to play when shooting.
+
+        Returns:
+            bool: True if the bullet was fired, False otherwise.
         """
         self.shoot_timer += 1
         # The alien can shoot once its half has appeared on the screen.
-        if (self.shoot_timer >= self.shoot_delay and self.y_pos +
-                self.height / 2 >= 0):
+        if (self.shoot_timer >= self.shoot_delay and
+                self.y_pos + self.half_height >= 0):
             self.shoot(sound)
             self.shoot_timer = 0
+            return True
+
+        return False
 
     def move(self, direction, screen_w, screen_h):
         """
@@ -97,17 +112,17 @@ class Spaceship(Entity):
                 the alien spaceship goes off-screen.
         """
         if self.is_player:
-            self.x_pos += self.speed * direction
-
-            if self.x_pos <= 0:
-                self.x_pos = 0
-            elif self.x_pos + self.width >= screen_w:
-                self.x_pos = screen_w - self.width
+            # The player is kept inside the screen.
+            x_pos = max(0, min(self.x_pos + self.speed * direction,
+                               screen_w - self.width))
 
-            self.placeholder.x = self.x_pos
+            self.x_pos = x_pos
+            self.placeholder.x = x_pos
         else:
-            self.y_pos += self.speed * direction
-            self.placeholder.y = self.y_pos
+            y_pos = self.y_pos + self.speed * direction
+            placeholder = self.placeholder
+            self.y_pos = y_pos
+            placeholder.y = y_pos
 
-            if self.placeholder.y + self.height >= screen_h - 120:
+            if placeholder.y + self.height >= screen_h - 120:
                 self.is_killed = True